@@ -1,13 +1,18 @@
-from abc import ABC
+import re
 from collections.abc import Iterable, Iterator, Mapping
+from functools import lru_cache
+from io import StringIO
 from types import NotImplementedType
 from typing import (
     Final,
+    NamedTuple,
     NewType,
     NoReturn,
     NotRequired,
+    Protocol,
     TypedDict,
     Unpack,
+    cast,
     final,
     overload,
     override,
@@ -28,14 +33,31 @@ def check_name(text: str) -> Name:
 
 SPECIAL_CHARS: Final[frozenset[str]] = frozenset(('[', ']', '=', ';', ','))
 
+_SPECIAL_CHARS_RE: Final[re.Pattern[str]] = re.compile(
+    f'[{re.escape("".join(SPECIAL_CHARS))}]'
+)
+
+_ESCAPE_TABLE: Final[dict[int, str]] = str.maketrans(
+    {char: f'\\{char}' for char in ('\\', *SPECIAL_CHARS)}
+)
+
 
 @final
 class Value:
+    __slots__ = ('text', '_contains_special_chars', '_str')
+
     @override
     def __init__(self, value: int | str) -> None:
         if isinstance(value, int):
             value = str(value)
-        self.text: str = value
+        self.text: Final[str] = value
+        self._contains_special_chars: bool | None = None
+        self._str: str | None = None
+
+    @classmethod
+    @lru_cache(maxsize=1024, typed=True)
+    def from_int(cls, value: int) -> Value:
+        return cls(value)
 
     @override
     def __hash__(self) -> int:
@@ -59,51 +81,43 @@ class Value:
 
     @override
     def __str__(self) -> str:
-        value = self.text
-        if self.contains_special_chars:
-            value = value.replace('\\', '\\\\')
-            for char in SPECIAL_CHARS:
-                value = value.replace(char, f'\\{char}')
-        return value
+        if self._str is None:
+            if self.contains_special_chars:
+                self._str = self.text.translate(_ESCAPE_TABLE)
+            else:
+                self._str = self.text
+        return self._str
+
+    def _write(self, buf: StringIO, /) -> None:
+        buf.write(str(self))
 
     @property
     def contains_special_chars(self) -> bool:
-        return not SPECIAL_CHARS.isdisjoint(self.text)
-
-
-class Argument(ABC):
-    @override
-    def __init__(self, value: Value | int | str) -> None:
-        if isinstance(value, (int, str)):
-            value = Value(value)
-        self.value: Final[Value] = value
-
-
-@final
-class PositionalArgument(Argument):
-    @override
-    def __repr__(self) -> str:
-        return f'{type(self).__name__}({self.value!r})'
+        if self._contains_special_chars is None:
+            self._contains_special_chars = (
+                _SPECIAL_CHARS_RE.search(self.text) is not None
+            )
+        return self._contains_special_chars
 
-    @override
-    def __str__(self) -> str:
-        return str(self.value)
 
+def _to_value(value: Value | int | str) -> Value:
+    if isinstance(value, Value):
+        return value
+    if isinstance(value, int):
+        return Value.from_int(value)
+    return Value(value)
 
-@final
-class KeyArgument(Argument):
-    @override
-    def __init__(self, key: str, value: Value | int | str) -> None:
-        super().__init__(value)
-        self.key = key
 
-    @override
-    def __repr__(self) -> str:
-        return f'{type(self).__name__}({self.key!r}, {self.value!r})'
+class Argument(NamedTuple):
+    key: str | None
+    value: Value | int | str
 
     @override
     def __str__(self) -> str:
-        return f'{self.key}={self.value}'
+        value = _to_value(self.value)
+        if self.key is None:
+            return str(value)
+        return f'{self.key}={value}'
 
 
 class _Kwargs(TypedDict):
@@ -113,41 +127,79 @@ class _Kwargs(TypedDict):
 
 
 class Arguments:
+    __slots__ = ('_keys', '_values', '_requires_quotes', '_str')
+
     @override
     def __init__(
         self,
         *args: Arguments | Argument | Value | int | str,
         **kwargs: Value | int | str,
     ) -> None:
-        self._all: Final[list[Argument]] = []
+        self._keys: Final[list[str | None]] = []
+        self._values: Final[list[Value]] = []
+        self._requires_quotes: bool = False
+        self._str: str | None = None
         for arg in args:
             if isinstance(arg, Arguments):
-                self.extend(arg)
+                self._keys.extend(arg._keys)
+                self._values.extend(arg._values)
+                self._requires_quotes |= arg._requires_quotes
+            elif isinstance(arg, Argument) and isinstance(
+                arg.value, (Value, int, str)
+            ):
+                self._add(arg.key, _to_value(arg.value))
             else:
                 self.append(arg)
-        for key, value in kwargs.items():
-            self.append(key, value)
+        if kwargs:
+            for value in kwargs.values():
+                if not isinstance(value, (Value, int, str)):
+                    raise ValueError(
+                        f'invalid args {args!r} and kwargs {kwargs!r}'
+                    )
+            values = list(map(_to_value, kwargs.values()))
+            self._keys.extend(kwargs)
+            self._values.extend(values)
+            self._requires_quotes |= any(
+                value.contains_special_chars for value in values
+            )
 
     def __bool__(self) -> bool:
-        return bool(self._all)
+        return bool(self._values)
 
     def __iter__(self) -> Iterator[Argument]:
-        return iter(self._all)
+        return map(Argument, self._keys, self._values)
 
     @override
     def __repr__(self) -> str:
-        return f'{type(self).__name__}({", ".join(map(repr, self._all))})'
+        return f'{type(self).__name__}({", ".join(map(repr, self))})'
 
     @override
     def __str__(self) -> str:
-        text = ':'.join(map(str, self))
-        if self.requires_quotes:
-            text = f"'{text}'"
-        return text
+        if self._str is None:
+            buf = StringIO()
+            requires_quotes = self.requires_quotes
+            if requires_quotes:
+                buf.write("'")
+            for index, (key, value) in enumerate(
+                zip(self._keys, self._values)
+            ):
+                if index:
+                    buf.write(':')
+                if key is not None:
+                    buf.write(key)
+                    buf.write('=')
+                value._write(buf)
+            if requires_quotes:
+                buf.write("'")
+            self._str = buf.getvalue()
+        return self._str
+
+    def _write(self, buf: StringIO, /) -> None:
+        buf.write(str(self))
 
     @property
     def requires_quotes(self) -> bool:
-        return any(arg.value.contains_special_chars for arg in self)
+        return self._requires_quotes
 
     @overload
     def append(self, key: str, value: Value | int | str) -> None: ...
@@ -163,38 +215,46 @@ class Arguments:
         *args: Argument | Value | int | str,
         **kwargs: Unpack[_Kwargs],
     ) -> None:
-        # fmt: off
-        match (args, kwargs):
-            case (
-                ([Argument() as arg], {}) |
-                ([], {'argument': Argument() as arg})
-            ):
-                pass
-
-            case (
-                ([Value() | int() | str() as value,], {}) |
-                ([], {'value': Value() | int() | str() as value})
-            ):
-                arg = PositionalArgument(value)
-
-            case (
-                ([str() as key, Value() | int() | str() as value], {}) |
-                ([str() as key], {'value': Value() | int() | str() as value}) |
-                ([Value() | int() | str() as value], {'key': str() as key}) |
-                (
-                    [],
-                    {
-                        'key': str() as key,
-                        'value': Value() | int() | str() as value
-                    }
-                )
-            ):
-                arg = KeyArgument(key, value)
+        key: str | None = None
+        value: object = None
+        if not kwargs:
+            if len(args) == 1:
+                value = args[0]
+                if isinstance(value, Argument):
+                    key, value = value
+            elif len(args) == 2 and isinstance(args[0], str):
+                key = args[0]
+                value = args[1]
+        elif kwargs.keys() == {'argument'}:
+            argument = kwargs.get('argument')
+            if not args and isinstance(argument, Argument):
+                key, value = argument
+        elif kwargs.keys() == {'value'}:
+            if not args:
+                value = kwargs.get('value')
+            elif len(args) == 1 and isinstance(args[0], str):
+                key = args[0]
+                value = kwargs.get('value')
+        elif kwargs.keys() == {'key'}:
+            kwargs_key = kwargs.get('key')
+            if len(args) == 1 and isinstance(kwargs_key, str):
+                key = kwargs_key
+                value = args[0]
+        elif kwargs.keys() == {'key', 'value'}:
+            kwargs_key = kwargs.get('key')
+            if not args and isinstance(kwargs_key, str):
+                key = kwargs_key
+                value = kwargs.get('value')
+
+        if not isinstance(value, (Value, int, str)):
+            raise ValueError(f'invalid args {args!r} and kwargs {kwargs!r}')
+        self._add(key, _to_value(value))
 
-            case _:
-                raise ValueError(f'invalid args {args!r} and kwargs {kwargs!r}')
-        # fmt: on
-        self._all.append(arg)
+    def _add(self, key: str | None, value: Value) -> None:
+        self._keys.append(key)
+        self._values.append(value)
+        self._requires_quotes |= value.contains_special_chars
+        self._str = None
 
     def extend(self, args: Iterable[Argument]) -> None:
         for arg in args:
@@ -203,8 +263,11 @@ class Arguments:
 
 @final
 class Link:
+    __slots__ = ('name', '_str')
+
     def __init__(self, name: str) -> None:
-        self.name = name
+        self.name: Final = name
+        self._str: Final = f'[{name}]'
 
     @override
     def __repr__(self) -> str:
@@ -212,14 +275,20 @@ class Link:
 
     @override
     def __str__(self) -> str:
-        return f'[{self.name}]'
+        return self._str
+
+    def _write(self, buf: StringIO, /) -> None:
+        buf.write(self._str)
 
 
 @final
 class Links:
+    __slots__ = ('_all', '_str')
+
     @override
     def __init__(self, links: Iterable[Link] = ()) -> None:
         self._all: Final[list[Link]] = list(links)
+        self._str: str | None = None
 
     def __iter__(self) -> Iterator[Link]:
         return iter(self._all)
@@ -230,12 +299,18 @@ class Links:
 
     @override
     def __str__(self) -> str:
-        return ''.join(map(str, self))
+        if self._str is None:
+            self._str = ''.join(map(str, self._all))
+        return self._str
+
+    def _write(self, buf: StringIO, /) -> None:
+        buf.write(str(self))
 
     def append(self, link: Link | str) -> Link:
         if isinstance(link, str):
             link = Link(link)
         self._all.append(link)
+        self._str = None
         return link
 
 
@@ -259,6 +334,8 @@ def _prepare_links(
 
 @final
 class Filter:
+    __slots__ = ('name', 'arguments', 'input', 'output')
+
     @override
     def __init__(
         self,
@@ -282,16 +359,33 @@ class Filter:
 
     @override
     def __str__(self) -> str:
-        frags = [str(self.input), self.name]
         if self.arguments:
-            frags.append('=')
-            frags.append(str(self.arguments))
-        frags.append(str(self.output))
-        return ''.join(frags)
+            return f'{self.input}{self.name}={self.arguments}{self.output}'
+        return f'{self.input}{self.name}{self.output}'
+
+    def _write(self, buf: StringIO, /) -> None:
+        self.input._write(buf)
+        buf.write(self.name)
+        if self.arguments:
+            buf.write('=')
+            self.arguments._write(buf)
+        self.output._write(buf)
+
+
+class _Writable(Protocol):
+    def _write(self, buf: StringIO, /) -> None: ...
+
+
+def _render(obj: _Writable) -> str:
+    buf = StringIO()
+    obj._write(buf)
+    return buf.getvalue()
 
 
 @final
 class FilterChain:
+    __slots__ = ('_filters',)
+
     @override
     def __init__(self, filters: Iterable[Filter] | None = None) -> None:
         if filters is None:
@@ -313,11 +407,19 @@ class FilterChain:
 
     @override
     def __str__(self) -> str:
-        return ','.join(map(str, self._filters))
+        return _render(self)
+
+    def _write(self, buf: StringIO, /) -> None:
+        for index, filter in enumerate(self._filters):
+            if index:
+                buf.write(',')
+            filter._write(buf)
 
 
 @final
 class FilterGraph:
+    __slots__ = ('_chains',)
+
     @override
     def __init__(self, chains: Iterable[FilterChain] | None = None) -> None:
         if chains is None:
@@ -339,7 +441,13 @@ class FilterGraph:
 
     @override
     def __str__(self) -> str:
-        return ';'.join(map(str, self))
+        return _render(self)
+
+    def _write(self, buf: StringIO, /) -> None:
+        for index, chain in enumerate(self._chains):
+            if index:
+                buf.write(';')
+            chain._write(buf)
 
     @overload
     def append(self, chain: FilterChain | None = None) -> FilterChain: ...
@@ -367,14 +475,11 @@ class FilterGraph:
         if kwargs:
             error()
 
-        filters: list[Filter] = []
-
         for arg in args:
             if not isinstance(arg, Filter):
                 error()
-            filters.append(arg)
 
-        chain = FilterChain(filters=filters)
+        chain = FilterChain(filters=cast(tuple[Filter, ...], args))
         self._chains.append(chain)
         return chain
 
@@ -31,6 +31,12 @@ def test_value_ne():
     assert v1 != v2
 
 
+def test_value_from_int():
+    assert ffbuild.Value.from_int(1) is ffbuild.Value.from_int(1)
+    assert ffbuild.Value.from_int(1) == ffbuild.Value('1')
+    assert str(ffbuild.Value.from_int(True)) == 'True'
+
+
 @pytest.mark.parametrize('special_char', ffbuild.SPECIAL_CHARS)
 def test_value_contains_special_chars(special_char):
     v = ffbuild.Value(special_char)
@@ -87,6 +93,168 @@ def test_value_str_slash_with_special_char():
     assert str(v) == r'\=\\'  # \=\\
 
 
+def test_value_str_mixed_special_chars():
+    v = ffbuild.Value('a=[b];c,\\d')
+    assert str(v) == r'a\=\[b\]\;c\,\\d'
+
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs'),
+    [
+        (('a',), {}),
+        ((), {'value': 'a'}),
+        ((ffbuild.Argument(None, ffbuild.Value('a')),), {}),
+        ((), {'argument': ffbuild.Argument(None, ffbuild.Value('a'))}),
+    ],
+)
+def test_arguments_append_positional(args, kwargs):
+    arguments = ffbuild.Arguments()
+    arguments.append(*args, **kwargs)
+    assert str(arguments) == 'a'
+
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs'),
+    [
+        (('k', 'v'), {}),
+        (('k',), {'value': 'v'}),
+        (('v',), {'key': 'k'}),
+        ((), {'key': 'k', 'value': 'v'}),
+    ],
+)
+def test_arguments_append_key(args, kwargs):
+    arguments = ffbuild.Arguments()
+    arguments.append(*args, **kwargs)
+    assert str(arguments) == 'k=v'
+
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs'),
+    [
+        ((), {}),
+        ((1, 'v'), {}),
+        (('k', 'v', 'x'), {}),
+        ((None,), {}),
+        ((), {'key': 'k'}),
+        (('v',), {'argument': ffbuild.Argument(None, ffbuild.Value('a'))}),
+    ],
+)
+def test_arguments_append_invalid(args, kwargs):
+    arguments = ffbuild.Arguments()
+    with pytest.raises(ValueError):
+        arguments.append(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs'),
+    [
+        ((None,), {}),
+        ((ffbuild.Argument(None, None),), {}),
+        ((), {'a': None}),
+        ((), {'a': 1.5}),
+    ],
+)
+def test_arguments_init_invalid(args, kwargs):
+    with pytest.raises(ValueError):
+        ffbuild.Arguments(*args, **kwargs)
+
+
+def test_filter_invalid_kwargs():
+    with pytest.raises(ValueError):
+        ffbuild.Filter('scale', w=None)
+    with pytest.raises(ValueError):
+        ffbuild.Filter('scale', kwargs={'w': 1.5})
+
+
+def test_arguments_init():
+    arguments = ffbuild.Arguments(
+        ffbuild.Arguments('a', b='c'),
+        ffbuild.Argument(None, ffbuild.Value('d')),
+        'e',
+        f='g,',
+    )
+    assert str(arguments) == r"'a:b=c:d:e:f=g\,'"
+
+
+def test_arguments_iter():
+    arguments = ffbuild.Arguments('a', b='c')
+    assert list(map(repr, arguments)) == [
+        "Argument(key=None, value=Value('a'))",
+        "Argument(key='b', value=Value('c'))",
+    ]
+
+
+@pytest.mark.parametrize(
+    ('argument', 'text'),
+    [
+        (ffbuild.Argument(None, 'a=b'), r'a\=b'),
+        (ffbuild.Argument(None, ffbuild.Value('a=b')), r'a\=b'),
+        (ffbuild.Argument('k', 'a=b'), r'k=a\=b'),
+        (ffbuild.Argument('k', 1), 'k=1'),
+    ],
+)
+def test_argument_str(argument, text):
+    assert str(argument) == text
+
+
+def test_arguments_argument_raw_value():
+    arguments = ffbuild.Arguments(ffbuild.Argument(None, 'a=b'))
+    arguments.append(ffbuild.Argument('k', 'c'))
+    assert str(arguments) == r"'a\=b:k=c'"
+    assert list(arguments)[0].value == ffbuild.Value('a=b')
+
+
+def test_arguments_requires_quotes():
+    arguments = ffbuild.Arguments('a', b='c')
+    assert not arguments.requires_quotes
+    arguments.append('d,e')
+    assert arguments.requires_quotes
+    arguments.append('f')
+    assert arguments.requires_quotes
+
+
+def test_arguments_str_after_append():
+    arguments = ffbuild.Arguments('a')
+    assert str(arguments) == 'a'
+    arguments.append('b', 'c=')
+    assert str(arguments) == r"'a:b=c\='"
+
+
+def test_links_str_after_append():
+    links = ffbuild.Links((ffbuild.Link('a'),))
+    assert str(links) == '[a]'
+    links.append('b')
+    assert str(links) == '[a][b]'
+
+
+def test_filter_graph_append_invalid():
+    graph = ffbuild.FilterGraph()
+    with pytest.raises(ValueError):
+        graph.append(ffbuild.Filter('null'), 'null')
+    assert not graph
+
+
+@pytest.mark.parametrize(
+    ('filter', 'text'),
+    [
+        (
+            ffbuild.Filter('select', 'eq(n, 0)', input='a', output='c'),
+            r"[a]select='eq(n\, 0)'[c]",
+        ),
+        (
+            ffbuild.Filter('split', input='0:v', output=('a', 'b')),
+            '[0:v]split[a][b]',
+        ),
+        (ffbuild.Filter('null'), 'null'),
+    ],
+)
+def test_filter_str_matches_graph(filter, text):
+    graph = ffbuild.FilterGraph()
+    graph.append(filter)
+    assert str(filter) == text
+    assert str(graph) == text
+
+
 def test_complex_1():
     graph = ffbuild.FilterGraph()
     (split,) = graph.append_filter('split', input='0:v', output=('a', 'b'))